@@ -15,7 +15,11 @@ How it works:
 - When a symbolic value must be converted to a concrete Python value
   (materialization), the graph is compiled using `Compiler` to apply simple
   optimizations (dead code elimination, constant folding, etc.) and then
-  executed with the current Python environment values.
+  executed with the current Python environment values. Input types observed
+  at capture time are recorded on the input nodes, and the first call
+  specializes each region for them. The resulting `SpecializedGraph` is cached
+  on the decorated function by region structure, so later calls reuse it:
+  matching input types take the specialized graph, others the generic one.
 - The `region_jit` decorator wraps a Python function to transparently enable
   this behavior: supported arithmetic becomes graph regions, but everything
   else falls back to normal Python execution.
@@ -34,7 +38,7 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from ..graph import Graph, Node
 from ..compiler import Compiler
-from ..runtime import execute
+from ..runtime import SpecializedGraph
 from ..debug import log
 
 SUPPORTED_BIN_OPS = {"BINARY_ADD", "BINARY_MULTIPLY"}
@@ -60,42 +64,82 @@ class SymVal:
     @property
     def is_py(self) -> bool: return self.py is not None
 
+RegionKey = Tuple[Tuple[str, Any, Tuple[int, ...]], ...]
+
+def region_key(n: Node) -> RegionKey:
+    """Structural key for the region computing ``n``: ops, input names and
+    const values (tagged with their type, since 1 == 1.0 == True)."""
+    index: Dict[Node, int] = {}
+    order: List[Tuple[str, Any, Tuple[int, ...]]] = []
+
+    def visit(m: Node) -> int:
+        if m in index: return index[m]
+        args = tuple(visit(i) for i in m.inputs)
+        if m.op == "const":
+            v = m.attrs["value"]; tag: Any = (type(v), v)
+        else:
+            tag = m.name
+        index[m] = len(order)
+        order.append((m.op, tag, args))
+        return index[m]
+
+    visit(n)
+    return tuple(order)
+
 class CaptureSession:
-    """Holds a single growing graph and a mapping for input name -> Node."""
-    def __init__(self):
+    """Holds a single growing graph and a mapping for input name -> Node.
+
+    ``regions`` caches compiled regions by ``region_key``; pass the same dict
+    to sessions of later calls to reuse them.
+    """
+    def __init__(self, regions: Optional[Dict[RegionKey, SpecializedGraph]] = None):
         self.g = Graph()
         self.inputs: Dict[str, Node] = {}
+        self.values: Dict[str, Any] = {}   # lifted Python values: input name -> value
+        self.regions = regions if regions is not None else {}
 
-    def input(self, name: str) -> Node:
+    def input(self, name: str, observed: Optional[type] = None) -> Node:
         if name not in self.inputs:
             self.inputs[name] = self.g.input(name)
+        if observed is not None:
+            self.inputs[name].attrs["type"] = observed
         return self.inputs[name]
 
     def const(self, v: Any) -> Node:
         return self.g.const(v)
 
+    def lift(self, v: Any) -> Node:
+        """Feed a value computed in Python into the graph as an input rather than
+        a const, so the region's structure does not depend on it."""
+        name = f"%py{len(self.values)}"
+        self.values[name] = v
+        return self.input(name, observed=type(v))
+
     def eval_node(self, n: Node, env: Dict[str, Any]) -> Any:
         log(f"EXEC graph region for node: {n}")
-        # Temporarily set output to n and execute the *compiled* graph
-        old_outs = list(self.g.outputs)
-        self.g.set_outputs(n)
-        try:
-            # Compile the current graph to enable optimizations (e.g., DCE, const-fold)
-            g_opt = Compiler().compile(self.g)
-            val = execute(g_opt, **env)
-        finally:
-            # Restore original outputs regardless of success/failure
-            self.g.outputs = old_outs
-        return val
+        key = region_key(n)
+        sg = self.regions.get(key)
+        if sg is None:
+            # Temporarily set output to n and compile the region, specialized on
+            # the input types observed at capture time
+            old_outs = list(self.g.outputs)
+            self.g.set_outputs(n)
+            try:
+                sg = Compiler().specialize(self.g)
+            finally:
+                # Restore original outputs regardless of success/failure
+                self.g.outputs = old_outs
+            self.regions[key] = sg
+        return sg(**self.values, **env)
 
 class RegionInterpreter:
     """A very small bytecode interpreter that regionizes supported arithmetic (+, *)
     into a captured graph while executing everything else with normal Python semantics.
     """
-    def __init__(self, fn):
+    def __init__(self, fn, regions: Optional[Dict[RegionKey, SpecializedGraph]] = None):
         self.fn = fn
         self.instructions = list(dis.get_instructions(fn))
-        self.session = CaptureSession()
+        self.session = CaptureSession(regions)
         self.env: Dict[str, Any] = {}   # local variables: name -> concrete Python value or SymVal
 
     def run(self, *args, **kwargs):
@@ -118,7 +162,7 @@ class RegionInterpreter:
                     stack.append(v)
                 else:
                     # push as symbolic input so it can participate in captured regions
-                    n = self.session.input(instr.argval)
+                    n = self.session.input(instr.argval, observed=type(v))
                     stack.append(SymVal(node=n))
             elif op == "LOAD_CONST":
                 stack.append(SymVal(node=self.session.const(instr.argval)))
@@ -126,8 +170,8 @@ class RegionInterpreter:
                 log(f"CAPTURE op {instr.opname} {instr.argrepr}")
                 # binary op: combine top 2 stack items as symbolic nodes
                 b = stack.pop(); a = stack.pop()
-                an = a.node if a.is_sym else self.session.const(a.py)
-                bn = b.node if b.is_sym else self.session.const(b.py)
+                an = a.node if a.is_sym else self.session.lift(a.py)
+                bn = b.node if b.is_sym else self.session.lift(b.py)
                 if instr.argrepr in ("*", "MULTIPLY") or op == "BINARY_MULTIPLY":
                     out = self.session.g.add_op("mul", an, bn)
                 else:
@@ -190,8 +234,11 @@ def region_jit(fn):
     Supported arithmetic (+, *) is captured as a graph region and executed via the compiler.
     Unsupported ops (e.g., **) are executed with Python semantics, seamlessly interleaving.
     Captured regions are compiled with `Compiler` before being executed to apply optimizations.
+    Compiled regions are cached in `wrapped.regions` and reused across calls.
     """
+    regions: Dict[RegionKey, SpecializedGraph] = {}
     def wrapped(*args, **kwargs):
-        return RegionInterpreter(fn).run(*args, **kwargs)
+        return RegionInterpreter(fn, regions).run(*args, **kwargs)
     wrapped.__name__ = f"regionjit_{fn.__name__}"
+    wrapped.regions = regions
     return wrapped
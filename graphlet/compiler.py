@@ -1,7 +1,8 @@
 from __future__ import annotations
-from typing import Iterable, List, Protocol
+from typing import Dict, Iterable, List, Optional, Protocol
 from .graph import Graph
-from .passes import DeadCodeElimination, ConstantFolding
+from .passes import DeadCodeElimination, ConstantFolding, TypeInference, IntegerSimplification
+from .runtime import SpecializedGraph
 from .debug import log
 
 class Pass(Protocol):
@@ -20,4 +21,23 @@ class Compiler:
             log(f" Running pass: {p.__class__.__name__}")
             g = p.run(g)
         log("Compiler done")
-        return g
\ No newline at end of file
+        return g
+
+    def specialize(self, g: Graph, input_types: Optional[Dict[str, type]] = None) -> SpecializedGraph:
+        """Compile a copy of ``g`` once, then specialize a clone of the result.
+
+        Types come from ``input_types`` or from ``type`` attrs already on the
+        input nodes. Every typed input becomes a guard, even if the specialized
+        graph no longer reads it (x*0 -> 0 is only valid when x is an int).
+        """
+        generic = self.compile(g.clone())
+        spec = TypeInference(input_types).run(generic.clone())
+        guards = {
+            n.name: n.attrs["type"] for n in spec.nodes
+            if n.op == "input" and n.attrs["type"] is not None
+        }
+        log(f"Specializing on {guards}")
+        for p in (IntegerSimplification(), DeadCodeElimination()):
+            log(f" Running pass: {p.__class__.__name__}")
+            spec = p.run(spec)
+        return SpecializedGraph(generic, spec, guards)
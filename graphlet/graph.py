@@ -73,6 +73,17 @@ class Graph:
         for n in self.nodes:
             for i in n.inputs: i.users.add(n)
 
+    def clone(self) -> "Graph":
+        """Return a structural copy with fresh nodes (attrs are shallow-copied)."""
+        g = Graph()
+        mapping: Dict[Node, Node] = {}
+        for n in self.nodes:
+            m = Node(n.op, [mapping[i] for i in n.inputs], name=n.name, attrs=dict(n.attrs))
+            mapping[n] = m
+            g.nodes.append(m)
+        g.outputs = [mapping[o] for o in self.outputs]
+        return g
+
     def dump(self) -> str:
         lines = []
         for idx, n in enumerate(self.nodes):
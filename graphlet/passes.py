@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Set, Optional
+from typing import Dict, Set, Optional
 from .graph import Graph, Node
 from .debug import log
 
@@ -23,6 +23,7 @@ class ConstantFolding:
                         # Redirect users
                         for u in list(n.users):
                             u.inputs = [c if x is n else x for x in u.inputs]
+                        g.outputs = [c if o is n else o for o in g.outputs]
                         # Remove the old node from graph order (keep order stable: swap in place)
                         idx = g.nodes.index(n)
                         g.nodes[idx] = c
@@ -52,3 +53,86 @@ class DeadCodeElimination:
         g.nodes = [n for n in g.nodes if n in live]
         g.relink()
         return g
+
+# Numeric tower used for add/mul result types; bool arithmetic yields int.
+_NUMERIC_RANK = {bool: 0, int: 1, float: 2, complex: 3}
+
+def _promote(a: Optional[type], b: Optional[type]) -> Optional[type]:
+    if a in _NUMERIC_RANK and b in _NUMERIC_RANK:
+        t = a if _NUMERIC_RANK[a] >= _NUMERIC_RANK[b] else b
+        return int if t is bool else t
+    return None
+
+class TypeInference:
+    """Annotate every node with its Python result type in ``attrs["type"]``.
+
+    Input types come from ``input_types`` (name -> type) or from a ``type``
+    attr already present on the input node (e.g. observed at capture time).
+    Unknown types are recorded as ``None``.
+    """
+    def __init__(self, input_types: Optional[Dict[str, type]] = None) -> None:
+        self.input_types = dict(input_types or {})
+
+    def run(self, g: Graph) -> Graph:
+        for n in g.nodes:
+            if n.op == "input":
+                t = self.input_types.get(n.name, n.attrs.get("type"))
+            elif n.op == "const":
+                t = type(n.attrs["value"])
+            elif n.op in ("add", "mul"):
+                a, b = n.inputs
+                t = _promote(a.attrs.get("type"), b.attrs.get("type"))
+            else:
+                t = None
+            n.attrs["type"] = t
+        return g
+
+class IntegerSimplification:
+    """Type-guarded algebraic identities: x*1 -> x, and for ints x+0 -> x, x*0 -> 0.
+
+    x*1 is exact for every int and float (including nan, inf and -0.0), but
+    x+0 and x*0 are int-only (-0.0 + 0 is 0.0, nan * 0 is nan). The pass
+    relies on ``TypeInference`` annotations and leaves untyped nodes alone.
+    Replaced nodes are left for ``DeadCodeElimination``.
+    """
+    def run(self, g: Graph) -> Graph:
+        g.relink()
+        for n in list(g.nodes):
+            if n.op not in ("add", "mul"):
+                continue
+            a, b = n.inputs
+            for x, k in ((a, b), (b, a)):
+                repl = self._simplify(n, x, k)
+                if repl is not None:
+                    self._replace(g, n, repl)
+                    log(f"IntSimplify: {n!r} -> {repl!r}")
+                    break
+        g.relink()
+        return g
+
+    @staticmethod
+    def _simplify(n: Node, x: Node, k: Node) -> Optional[Node]:
+        t = x.attrs.get("type")
+        # x must already have the result type, e.g. int * 1.0 is a float, not x
+        if k.op != "const" or t not in (int, float) or n.attrs.get("type") is not t:
+            return None
+        kv = k.attrs["value"]
+        if n.op == "mul" and type(kv) in (int, float) and kv == 1:
+            return x
+        if t is not int or type(kv) is not int:
+            return None
+        if n.op == "add" and kv == 0:
+            return x
+        if n.op == "mul" and kv == 0:
+            return Node("const", [], attrs={"value": 0, "type": int})
+        return None
+
+    @staticmethod
+    def _replace(g: Graph, old: Node, new: Node) -> None:
+        if new not in g.nodes:
+            # Keep g.nodes topologically ordered: place new consts before old
+            g.nodes.insert(g.nodes.index(old), new)
+        for u in list(old.users):
+            u.inputs = [new if x is old else x for x in u.inputs]
+            new.users.add(u)
+        g.outputs = [new if o is old else o for o in g.outputs]
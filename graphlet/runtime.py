@@ -11,9 +11,17 @@ The execution is recursive: each node is evaluated on demand,
 and results are memoized in a cache to avoid recomputation.
 This design is not optimized for performance, but offers clarity
 and simplicity for understanding how graphs are executed.
+
+``build_fast`` flattens a graph into a straight-line program once, so calls
+skip the per-node op dispatch and recursion. The flattening does not depend
+on types. ``SpecializedGraph`` (see ``Compiler.specialize``) holds a
+type-specialized graph and the generic graph, both flattened; a cheap type
+check on the inputs picks which one runs.
 """
-from typing import Any, Dict
+import operator
+from typing import Any, Callable, Dict, List, Tuple
 from .graph import Graph, Node
+from .debug import log
 
 def _eval_node(n: Node, env: Dict[str, Any], cache: Dict[Node, Any]) -> Any:
     if n in cache: return cache[n]
@@ -47,3 +55,71 @@ def execute(g: Graph, **inputs) -> Any:
     if len(g.outputs) == 1:
         return _eval_node(g.outputs[0], inputs, cache)
     return tuple(_eval_node(o, inputs, cache) for o in g.outputs)
+
+_FAST_OPS: Dict[str, Callable[[Any, Any], Any]] = {"add": operator.add, "mul": operator.mul}
+
+def build_fast(g: Graph) -> Callable[..., Any]:
+    """Flatten a graph into a straight-line program over a slot list.
+
+    Op dispatch and recursion happen once here rather than per call; each call
+    just applies ``operator`` functions in topological order. This is
+    independent of value types and gives the same results as ``execute``.
+    """
+    if not g.outputs:
+        raise ValueError("build_fast() expects at least one output")
+    slot: Dict[Node, int] = {}
+    template: List[Any] = []
+    loads: List[Tuple[int, str]] = []
+    steps: List[Tuple[int, Callable[[Any, Any], Any], int, int]] = []
+
+    def visit(n: Node) -> int:
+        if n in slot: return slot[n]
+        args = [visit(i) for i in n.inputs]
+        idx = slot[n] = len(template)
+        template.append(None)
+        if n.op == "input":
+            loads.append((idx, n.name))
+        elif n.op == "const":
+            template[idx] = n.attrs["value"]
+        elif n.op in _FAST_OPS:
+            steps.append((idx, _FAST_OPS[n.op], args[0], args[1]))
+        else:
+            raise NotImplementedError(f"Execution not supported for op: {n.op}")
+        return idx
+
+    outs = [visit(o) for o in g.outputs]
+
+    def run(**inputs) -> Any:
+        vals = list(template)
+        for idx, name in loads: vals[idx] = inputs[name]
+        for idx, fn, a, b in steps: vals[idx] = fn(vals[a], vals[b])
+        if len(outs) == 1:
+            return vals[outs[0]]
+        return tuple(vals[o] for o in outs)
+    return run
+
+class SpecializedGraph:
+    """A type-specialized graph guarded by exact input types, with a generic fallback.
+
+    Only the graph itself is type-specialized (``IntegerSimplification``);
+    both graphs run through ``build_fast``. Calls whose inputs match
+    ``guards`` (``type(v) is t``) run the specialized graph; anything else
+    runs the generic one, flattened on the first guard failure.
+    """
+    def __init__(self, generic: Graph, specialized: Graph, guards: Dict[str, type]) -> None:
+        self.generic = generic
+        self.specialized = specialized
+        self.guards = dict(guards)
+        self._fast = build_fast(specialized)
+        self._generic_fast: Callable[..., Any] | None = None
+
+    def check(self, inputs: Dict[str, Any]) -> bool:
+        return all(name in inputs and type(inputs[name]) is t for name, t in self.guards.items())
+
+    def __call__(self, **inputs) -> Any:
+        if self.check(inputs):
+            return self._fast(**inputs)
+        if self._generic_fast is None:
+            log(f"GUARD failed for {self.guards}; building generic fallback")
+            self._generic_fast = build_fast(self.generic)
+        return self._generic_fast(**inputs)
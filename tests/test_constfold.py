@@ -11,4 +11,13 @@ def test_constant_folding_add_mul():
 
     cg = Compiler().compile(g)
     dump = cg.dump()
-    assert "const(6)" in dump
\ No newline at end of file
+    assert "const(6)" in dump
+
+
+def test_constant_folding_redirects_outputs():
+    g = Graph()
+    y = g.add_op("mul", g.const(2), g.const(3))
+    g.set_outputs(y)
+    cg = Compiler().compile(g)
+    assert cg.outputs[0] in cg.nodes
+    assert repr(cg.outputs[0]) == "const(6)"
@@ -0,0 +1,68 @@
+import importlib
+import math
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+import graphlet
+
+
+@pytest.fixture
+def rj(monkeypatch):
+    """Import graphlet.capture.region_jit for one test.
+
+    graphlet/capture/__init__.py imports capture modules that are not in this
+    tree, so register a bare package for the duration of the test instead.
+    """
+    pkg = types.ModuleType("graphlet.capture")
+    pkg.__path__ = [str(Path(graphlet.__file__).parent / "capture")]
+    monkeypatch.setitem(sys.modules, "graphlet.capture", pkg)
+    monkeypatch.delitem(sys.modules, "graphlet.capture.region_jit", raising=False)
+    mod = importlib.import_module("graphlet.capture.region_jit")
+    monkeypatch.setitem(sys.modules, "graphlet.capture.region_jit", mod)
+    return mod
+
+
+def fn(a, b):
+    y = (a * 0 + b) * 1 + 0   # int-only rewrites apply
+    z = a ** 2                # Python fallback, lifted back into the graph
+    return y + z * 1
+
+def same(x, y):
+    if isinstance(x, float) and math.isnan(x):
+        return isinstance(y, float) and math.isnan(y)
+    return type(x) is type(y) and x == y and repr(x) == repr(y)
+
+
+def test_capture_session_records_observed_type(rj):
+    s = rj.CaptureSession()
+    n = s.input("a", observed=int)
+    assert n.attrs["type"] is int
+    assert s.input("a") is n and n.attrs["type"] is int
+
+
+def test_region_specialized_on_observed_int_types(rj):
+    jf = rj.region_jit(fn)
+    assert jf(2, 3) == fn(2, 3)
+    # The region for y reads both arguments and simplifies down to b
+    (sg,) = [sg for sg in jf.regions.values() if sg.guards == {"a": int, "b": int}]
+    assert sg.specialized.dump() == "%0: b\noutputs: %0"
+
+
+def test_region_cache_reused_and_falls_back_on_other_types(rj):
+    jf = rj.region_jit(fn)
+    jf(2, 3)
+    cached = dict(jf.regions)
+    for args in [(4, 5), (1.5, -0.0), (float("nan"), 1), (True, False), (-0.0, 0.0)]:
+        assert same(jf(*args), fn(*args)), args
+    # Same region structure: the int-specialized graphs are reused, not recompiled
+    assert jf.regions == cached
+
+
+def test_region_whose_output_folds_to_const(rj):
+    def f(a):
+        x = 2
+        return x * 3
+    assert rj.region_jit(f)(1) == 6
@@ -0,0 +1,85 @@
+import math
+from graphlet import Graph, Compiler
+from graphlet.passes import TypeInference, IntegerSimplification, DeadCodeElimination
+from graphlet.runtime import execute, build_fast
+
+def test_type_inference_promotes_numeric_types():
+    g = Graph()
+    a = g.input("a"); b = g.input("b"); s = g.input("s")
+    t1 = g.add_op("mul", a, g.const(2))   # int
+    t2 = g.add_op("add", t1, b)           # float
+    t3 = g.add_op("add", s, s)            # unknown
+    g.set_outputs(t2, t3)
+    TypeInference({"a": int, "b": float}).run(g)
+    assert t1.attrs["type"] is int
+    assert t2.attrs["type"] is float
+    assert s.attrs["type"] is None and t3.attrs["type"] is None
+
+def test_type_inference_uses_input_node_attrs():
+    g = Graph()
+    a = g.input("a"); a.attrs["type"] = bool
+    t = g.add_op("add", a, a)
+    g.set_outputs(t)
+    TypeInference().run(g)
+    assert t.attrs["type"] is int
+
+def test_integer_simplification_only_for_ints():
+    def build():
+        g = Graph()
+        x = g.input("x")
+        t = g.add_op("mul", x, g.const(1))
+        y = g.add_op("add", g.const(0), t)
+        g.set_outputs(y)
+        return g, x
+    g, x = build()
+    TypeInference({"x": int}).run(g)
+    IntegerSimplification().run(g)
+    DeadCodeElimination().run(g)
+    assert g.outputs == [x] and g.nodes == [x]
+
+    g, x = build()
+    TypeInference({"x": float}).run(g)
+    IntegerSimplification().run(g)
+    # x*1 is exact for floats, x+0 is not (-0.0 + 0 is 0.0)
+    assert g.outputs[0].inputs[1] is x
+    assert "add(const(0), x)" in g.dump()
+
+def test_mul_by_one_keeps_result_type():
+    g = Graph()
+    x = g.input("x")
+    y = g.add_op("mul", x, g.const(1.0))  # int * 1.0 is a float, not x
+    g.set_outputs(y)
+    TypeInference({"x": int}).run(g)
+    IntegerSimplification().run(g)
+    assert g.outputs == [y]
+
+def test_build_fast_matches_execute():
+    g = Graph()
+    a = g.input("a"); b = g.input("b")
+    s = g.add_op("add", a, b)
+    p = g.add_op("mul", s, g.const(3))
+    g.set_outputs(p, s)
+    assert build_fast(g)(a=2, b=5) == execute(g, a=2, b=5) == (21, 7)
+
+def test_specialize_guards_and_falls_back():
+    g = Graph()
+    x = g.input("x")
+    y = g.add_op("mul", x, g.const(0))
+    g.set_outputs(y)
+    sg = Compiler().specialize(g, {"x": int})
+    assert sg.guards == {"x": int}
+    assert "mul" not in sg.specialized.dump()
+    assert sg(x=7) == 0
+    # nan * 0 is nan: the int-only rewrite must not apply to floats
+    assert not sg.check({"x": 1.5})
+    assert math.isnan(sg(x=float("nan")))
+    # Original graph is left untouched
+    assert "mul(x, const(0))" in g.dump()
+
+def test_specialize_graph_whose_output_folds_to_const():
+    g = Graph()
+    g.input("a")
+    y = g.add_op("mul", g.const(2), g.const(3))
+    g.set_outputs(y)
+    sg = Compiler().specialize(g)
+    assert sg(a=1) == 6